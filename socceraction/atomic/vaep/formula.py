@@ -1,15 +1,23 @@
 """Implements the formula of the Atomic-VAEP framework."""
 
+import numpy as np
 import pandas as pd
 from pandera.typing import DataFrame, Series
 
+import socceraction.atomic.spadl.config as atomicspadl
 from socceraction.atomic.spadl import AtomicSPADLSchema
 
 
 def _prev(x: pd.Series) -> pd.Series:
-    prev_x = x.shift(1)
-    prev_x[:1] = x.values[0]
-    return prev_x
+    # shift the underlying array directly; Series.shift(1) upcasts to float
+    # and requires copying the first value back in afterwards
+    values = x.to_numpy()
+    return pd.Series(np.concatenate((values[:1], values[:-1])), index=x.index)
+
+
+# integer codes of the goal action types; the type_name column is optional in
+# the atomic SPADL schema and string comparisons are slower than these codes
+_goal_type_ids = [atomicspadl.actiontypes.index(ty) for ty in ("goal", "owngoal")]
 
 
 def offensive_value(
@@ -52,7 +60,7 @@ def offensive_value(
     # prev_scores[toolong_idx] = 0
 
     # if the previous action was a goal, the odds of scoring are now 0
-    prevgoal_idx = _prev(actions.type_name).isin(["goal", "owngoal"])
+    prevgoal_idx = _prev(actions.type_id).isin(_goal_type_ids)
     prev_scores[prevgoal_idx] = 0
 
     return scores - prev_scores
@@ -98,7 +106,7 @@ def defensive_value(
     # prev_concedes[toolong_idx] = 0
 
     # if the previous action was a goal, the odds of conceding are now 0
-    prevgoal_idx = _prev(actions.type_name).isin(["goal", "owngoal"])
+    prevgoal_idx = _prev(actions.type_id).isin(_goal_type_ids)
     prev_concedes[prevgoal_idx] = 0
 
     return -(concedes - prev_concedes)
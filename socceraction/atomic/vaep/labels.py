@@ -1,11 +1,45 @@
 """Implements the label tranformers of the Atomic-VAEP framework."""
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from pandera.typing import DataFrame
 
 import socceraction.atomic.spadl.config as atomicspadl
 from socceraction.atomic.spadl import AtomicSPADLSchema
 
+_goal_type_id = atomicspadl.actiontypes.index("goal")
+_owngoal_type_id = atomicspadl.actiontypes.index("owngoal")
+
+
+def _future_windows(
+    actions: DataFrame[AtomicSPADLSchema], nr_actions: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute goal, owngoal and team id windows over the next x actions.
+
+    Each returned array has shape (len(actions), nr_actions); row i holds the
+    values for action i and the nr_actions - 1 actions that follow it. The
+    windows are built with sliding views over the underlying arrays, padded by
+    repeating the last action, which avoids materializing 3 * (nr_actions - 1)
+    shifted columns.
+    """
+    type_id = actions["type_id"].to_numpy()
+    goals = type_id == _goal_type_id
+    owngoals = type_id == _owngoal_type_id
+    team_id = actions["team_id"].to_numpy()
+
+    nr_pad = nr_actions - 1
+    goal_w = sliding_window_view(
+        np.concatenate((goals, np.repeat(goals[-1:], nr_pad))), nr_actions
+    )
+    owngoal_w = sliding_window_view(
+        np.concatenate((owngoals, np.repeat(owngoals[-1:], nr_pad))), nr_actions
+    )
+    team_w = sliding_window_view(
+        np.concatenate((team_id, np.repeat(team_id[-1:], nr_pad))), nr_actions
+    )
+    return goal_w, owngoal_w, team_w
+
 
 def scores(actions: DataFrame[AtomicSPADLSchema], nr_actions: int = 10) -> pd.DataFrame:
     """Determine whether the team possessing the ball scored a goal within the next x actions.
@@ -24,26 +58,12 @@ def scores(actions: DataFrame[AtomicSPADLSchema], nr_actions: int = 10) -> pd.Da
         True if a goal was scored by the team possessing the ball within the
         next x actions; otherwise False.
     """
-    # merging goals, owngoals and team_ids
-    goals = actions["type_id"] == atomicspadl.actiontypes.index("goal")
-    owngoals = actions["type_id"] == atomicspadl.actiontypes.index("owngoal")
-    y = pd.concat([goals, owngoals, actions["team_id"]], axis=1)
-    y.columns = ["goal", "owngoal", "team_id"]
-
-    # adding future results
-    for i in range(1, nr_actions):
-        for c in ["team_id", "goal", "owngoal"]:
-            shifted = y[c].shift(-i)
-            shifted[-i:] = y[c].iloc[len(y) - 1]
-            y["%s+%d" % (c, i)] = shifted
+    goal_w, owngoal_w, team_w = _future_windows(actions, nr_actions)
 
-    res = y["goal"]
-    for i in range(1, nr_actions):
-        gi = y["goal+%d" % i] & (y["team_id+%d" % i] == y["team_id"])
-        ogi = y["owngoal+%d" % i] & (y["team_id+%d" % i] != y["team_id"])
-        res = res | gi | ogi
+    sameteam = team_w == team_w[:, :1]
+    res = ((goal_w & sameteam) | (owngoal_w & ~sameteam)).any(axis=1)
 
-    return pd.DataFrame(res, columns=["scores"])
+    return pd.DataFrame({"scores": res}, index=actions.index)
 
 
 def concedes(actions: DataFrame[AtomicSPADLSchema], nr_actions: int = 10) -> pd.DataFrame:
@@ -63,26 +83,12 @@ def concedes(actions: DataFrame[AtomicSPADLSchema], nr_actions: int = 10) -> pd.
         True if a goal was conceded by the team possessing the ball within the
         next x actions; otherwise False.
     """
-    # merging goals, owngoals and team_ids
-    goals = actions["type_id"] == atomicspadl.actiontypes.index("goal")
-    owngoals = actions["type_id"] == atomicspadl.actiontypes.index("owngoal")
-    y = pd.concat([goals, owngoals, actions["team_id"]], axis=1)
-    y.columns = ["goal", "owngoal", "team_id"]
-
-    # adding future results
-    for i in range(1, nr_actions):
-        for c in ["team_id", "goal", "owngoal"]:
-            shifted = y[c].shift(-i)
-            shifted[-i:] = y[c].iloc[len(y) - 1]
-            y["%s+%d" % (c, i)] = shifted
-
-    res = y["owngoal"]
-    for i in range(1, nr_actions):
-        gi = y["goal+%d" % i] & (y["team_id+%d" % i] != y["team_id"])
-        ogi = y["owngoal+%d" % i] & (y["team_id+%d" % i] == y["team_id"])
-        res = res | gi | ogi
-
-    return pd.DataFrame(res, columns=["concedes"])
+    goal_w, owngoal_w, team_w = _future_windows(actions, nr_actions)
+
+    sameteam = team_w == team_w[:, :1]
+    res = ((goal_w & ~sameteam) | (owngoal_w & sameteam)).any(axis=1)
+
+    return pd.DataFrame({"concedes": res}, index=actions.index)
 
 
 def goal_from_shot(actions: DataFrame[AtomicSPADLSchema]) -> pd.DataFrame:
@@ -5,6 +5,7 @@ stream data.
 """
 
 import base64
+import gzip
 import json
 import warnings
 from abc import ABC, abstractmethod
@@ -41,7 +42,14 @@ def _remoteloadjson(path: str) -> JSONType:
     JSONType
         A dictionary with the loaded JSON data.
     """
-    return json.loads(request.urlopen(path).read())
+    # ask for gzip compression; the raw JSON feeds compress by roughly 90%,
+    # which makes the transfer rather than the decode the saving
+    req = request.Request(path, headers={"Accept-Encoding": "gzip"})
+    with request.urlopen(req) as response:
+        data = response.read()
+        if response.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+    return json.loads(data)
 
 
 def _auth_remoteloadjson(user: str, passwd: str) -> None:
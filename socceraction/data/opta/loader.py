@@ -349,7 +349,7 @@ class OptaLoader(EventDataLoader):
                         loaded_seasons.add((competition_id, season_id))
                 parser = self.parsers[feed](ffp, **ids)
                 _deepupdate(data, parser.extract_competitions())
-        return cast(DataFrame[OptaCompetitionSchema], pd.DataFrame(list(data.values())))
+        return cast(DataFrame[OptaCompetitionSchema], pd.DataFrame(data.values()))
 
     def games(self, competition_id: int, season_id: int) -> DataFrame[OptaGameSchema]:
         """Return a dataframe with all available games in a season.
@@ -377,7 +377,7 @@ class OptaLoader(EventDataLoader):
                 ids = _extract_ids_from_path(ffp, feed_pattern)
                 parser = self.parsers[feed](ffp, **ids)
                 _deepupdate(data, parser.extract_games())
-        return cast(DataFrame[OptaGameSchema], pd.DataFrame(list(data.values())))
+        return cast(DataFrame[OptaGameSchema], pd.DataFrame(data.values()))
 
     def teams(self, game_id: int) -> DataFrame[OptaTeamSchema]:
         """Return a dataframe with both teams that participated in a game.
@@ -401,7 +401,7 @@ class OptaLoader(EventDataLoader):
                 ids = _extract_ids_from_path(ffp, feed_pattern)
                 parser = self.parsers[feed](ffp, **ids)
                 _deepupdate(data, parser.extract_teams())
-        return cast(DataFrame[OptaTeamSchema], pd.DataFrame(list(data.values())))
+        return cast(DataFrame[OptaTeamSchema], pd.DataFrame(data.values()))
 
     def players(self, game_id: int) -> DataFrame[OptaPlayerSchema]:
         """Return a dataframe with all players that participated in a game.
@@ -425,7 +425,7 @@ class OptaLoader(EventDataLoader):
                 ids = _extract_ids_from_path(ffp, feed_pattern)
                 parser = self.parsers[feed](ffp, **ids)
                 _deepupdate(data, parser.extract_players())
-        df_players = pd.DataFrame(list(data.values()))
+        df_players = pd.DataFrame(data.values())
         df_players["game_id"] = game_id
         return cast(DataFrame[OptaPlayerSchema], df_players)
 
@@ -451,20 +451,14 @@ class OptaLoader(EventDataLoader):
                 ids = _extract_ids_from_path(ffp, feed_pattern)
                 parser = self.parsers[feed](ffp, **ids)
                 _deepupdate(data, parser.extract_events())
-        events = (
-            pd.DataFrame(list(data.values()))
-            .merge(_eventtypesdf, on="type_id", how="left")
-            .sort_values(
-                ["game_id", "period_id", "minute", "second", "timestamp"], kind="mergesort"
-            )
-            .reset_index(drop=True)
-        )
+        events = pd.DataFrame(data.values()).merge(_eventtypesdf, on="type_id", how="left")
 
-        # sometimes pre-match events has -3, -2 and -1 seconds
+        # sometimes pre-match events has -3, -2 and -1 seconds; clip them
+        # before sorting so a single sort pass suffices
         events.loc[events.second < 0, "second"] = 0
         events = events.sort_values(
             ["game_id", "period_id", "minute", "second", "timestamp"], kind="mergesort"
-        )
+        ).reset_index(drop=True)
 
         # deleted events has wrong datetime which occurs OutOfBoundsDatetime error
         events = events[events.type_id != 43]
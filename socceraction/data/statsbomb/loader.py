@@ -76,6 +76,7 @@ class StatsBombLoader(EventDataLoader):
             self._root = root
         else:
             raise ValueError("Invalid getter specified")
+        self._lineups_cache: Optional[tuple[int, list[dict[str, Any]]]] = None
 
     def competitions(self) -> DataFrame[StatsBombCompetitionSchema]:
         """Return a dataframe with all available competitions and seasons.
@@ -179,6 +180,10 @@ class StatsBombLoader(EventDataLoader):
         return cast(DataFrame[StatsBombGameSchema], gamesdf[cols])
 
     def _lineups(self, game_id: int) -> list[dict[str, Any]]:
+        # teams() and players() both need the lineups of a game; keep the most
+        # recently fetched one around to avoid a second request or file read
+        if self._lineups_cache is not None and self._lineups_cache[0] == game_id:
+            return self._lineups_cache[1]
         if self._local:
             obj = _localloadjson(str(os.path.join(self._root, "lineups", f"{game_id}.json")))
         else:
@@ -187,6 +192,7 @@ class StatsBombLoader(EventDataLoader):
             raise ParseError("The retrieved data should contain a list of teams")
         if len(obj) != 2:
             raise ParseError("The retrieved data should contain two teams")
+        self._lineups_cache = (game_id, obj)
         return obj
 
     def teams(self, game_id: int) -> DataFrame[StatsBombTeamSchema]:
@@ -407,18 +413,23 @@ def extract_player_games(events: pd.DataFrame) -> pd.DataFrame:
 
     game_id = events.game_id.mode().values[0]
     players = {}
-    # Red cards
-    red_cards = events[
-        events.apply(
-            lambda x: any(
-                e in x.extra
-                and "card" in x.extra[e]
-                and x.extra[e]["card"]["name"] in ["Second Yellow", "Red Card"]
+    # Red cards; only foul and bad behaviour events can carry a card, so
+    # restrict the per-row scan to those instead of the full event stream
+    card_events = events[events.type_name.isin(["Foul Committed", "Bad Behaviour"])]
+    has_red_card = pd.Series(
+        [
+            any(
+                e in extra
+                and "card" in extra[e]
+                and extra[e]["card"]["name"] in ["Second Yellow", "Red Card"]
                 for e in ["foul_committed", "bad_behaviour"]
-            ),
-            axis=1,
-        )
-    ]
+            )
+            for extra in card_events["extra"]
+        ],
+        index=card_events.index,
+        dtype=bool,
+    )
+    red_cards = card_events[has_red_card]
     # stats for starting XI
     for startxi in events[events.type_name == "Starting XI"].itertuples():
         team_id, team_name = startxi.team_id, startxi.team_name
@@ -457,7 +468,11 @@ def extract_player_games(events: pd.DataFrame) -> pd.DataFrame:
             )
         players[replacement["player_id"]] = replacement
         players[substitution.player_id]["minutes_played"] = exp_sub_minute
-    pg = pd.DataFrame(players.values()).fillna(0)
+    pg = pd.DataFrame(players.values())
+    # only substitutes lack the position and jersey number fields; rewrite
+    # just the columns with missing values instead of the full frame
+    for col in pg.columns[pg.isna().any()]:
+        pg[col] = pg[col].fillna(0)
     for col in pg.columns:
         if "_id" in col:
             pg[col] = pg[col].astype(int)  # pylint: disable=E1136,E1137
@@ -1,9 +1,11 @@
 """Implements serializers for Wyscout data."""
 
+import copy
 import glob
 import os
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Optional, Union, cast
 from urllib.error import HTTPError
@@ -126,6 +128,7 @@ class PublicWyscoutLoader(EventDataLoader):
         ).set_index(["competition_id", "season_id"])
         self._match_index = self._create_match_index().set_index("match_id")
         self._cache: Optional[dict[str, Any]] = None
+        self._matches_cache: Optional[dict[str, Any]] = None
 
     def _download_repo(self) -> None:
         dataset_urls = {
@@ -135,30 +138,35 @@ class PublicWyscoutLoader(EventDataLoader):
             "matches": "https://ndownloader.figshare.com/files/14464622",
             "events": "https://ndownloader.figshare.com/files/14464685",
         }
-        # download and unzip Wyscout open data
-        for url in dataset_urls.values():
+        # download and unzip Wyscout open data; the downloads are
+        # network-bound, so fetch the files concurrently
+        def _download(url: str) -> str:
             url_obj = urlopen(url).geturl()
             path = Path(urlparse(url_obj).path)
             file_name = os.path.join(self.root, path.name)
             file_local, _ = urlretrieve(url_obj, file_name)
-            if is_zipfile(file_local):
-                with ZipFile(file_local) as zip_file:
-                    zip_file.extractall(self.root)
+            return file_local
+
+        with ThreadPoolExecutor(max_workers=len(dataset_urls)) as executor:
+            for file_local in executor.map(_download, dataset_urls.values()):
+                if is_zipfile(file_local):
+                    with ZipFile(file_local) as zip_file:
+                        zip_file.extractall(self.root)
 
     def _create_match_index(self) -> pd.DataFrame:
-        df_matches = pd.concat(
-            [pd.DataFrame(self.get(path)) for path in glob.iglob(f"{self.root}/matches_*.json")]
-        )
-        df_matches.rename(
-            columns={
-                "wyId": "match_id",
-                "competitionId": "competition_id",
-                "seasonId": "season_id",
-            },
-            inplace=True,
-        )
+        # only the IDs are needed to build the index; stream over the raw
+        # records instead of materializing a full dataframe per matches file
+        records = [
+            {
+                "match_id": match["wyId"],
+                "competition_id": match["competitionId"],
+                "season_id": match["seasonId"],
+            }
+            for path in glob.iglob(f"{self.root}/matches_*.json")
+            for match in cast(list[dict[str, Any]], self.get(path))
+        ]
         return pd.merge(
-            df_matches[["match_id", "competition_id", "season_id"]],
+            pd.DataFrame.from_records(records),
             self._index,
             on=["competition_id", "season_id"],
             how="left",
@@ -178,9 +186,10 @@ class PublicWyscoutLoader(EventDataLoader):
         df_competitions.rename(
             columns={"wyId": "competition_id", "name": "competition_name"}, inplace=True
         )
-        df_competitions["country_name"] = df_competitions.apply(
-            lambda x: x.area["name"] if x.area["name"] != "" else "International", axis=1
-        )
+        df_competitions["country_name"] = [
+            area["name"] if area["name"] != "" else "International"
+            for area in df_competitions["area"]
+        ]
         df_competitions["competition_gender"] = "male"
         df_competitions = pd.merge(
             df_competitions,
@@ -219,14 +228,24 @@ class PublicWyscoutLoader(EventDataLoader):
             :class:`~socceraction.spadl.wyscout.WyscoutGameSchema` for the schema.
         """
         path = os.path.join(self.root, self._index.at[(competition_id, season_id), "db_matches"])
-        df_matches = pd.DataFrame(self.get(path))
-        return cast(DataFrame[WyscoutGameSchema], _convert_games(df_matches))
+        return cast(DataFrame[WyscoutGameSchema], _convert_games(self._matches(path).reset_index()))
+
+    def _matches(self, path: str) -> pd.DataFrame:
+        if self._matches_cache is None or self._matches_cache["path"] != path:
+            # teams() and players() both look up the lineups of a game; keep
+            # the last parsed matches file around so it is read only once
+            self._matches_cache = {
+                "path": path,
+                "matches": pd.DataFrame(self.get(path)).set_index("wyId"),
+            }
+        return self._matches_cache["matches"]
 
     def _lineups(self, game_id: int) -> list[dict[str, Any]]:
         competition_id, season_id = self._match_index.loc[game_id, ["competition_id", "season_id"]]
         path = os.path.join(self.root, self._index.at[(competition_id, season_id), "db_matches"])
-        df_matches = pd.DataFrame(self.get(path)).set_index("wyId")
-        return list(df_matches.at[game_id, "teamsData"].values())
+        # hand out a deep copy: players() appends the substituted-in bench
+        # players to the lineups, which must not leak into the cached matches
+        return copy.deepcopy(list(self._matches(path).at[game_id, "teamsData"].values()))
 
     def teams(self, game_id: int) -> DataFrame[WyscoutTeamSchema]:
         """Return a dataframe with both teams that participated in a game.
@@ -243,9 +262,15 @@ class PublicWyscoutLoader(EventDataLoader):
             :class:`~socceraction.spadl.wyscout.WyscoutTeamSchema` for the schema.
         """
         path = os.path.join(self.root, "teams.json")
-        df_teams = pd.DataFrame(self.get(path)).set_index("wyId")
-        df_teams_match_id = pd.DataFrame(self._lineups(game_id))["teamId"]
-        df_teams_match = df_teams.loc[df_teams_match_id].reset_index()
+        # select the two participating teams from the raw records; building a
+        # dataframe of all teams just to pick two rows is wasteful
+        team_ids = [lineup["teamId"] for lineup in self._lineups(game_id)]
+        teams = {
+            team["wyId"]: team
+            for team in cast(list[dict[str, Any]], self.get(path))
+            if team["wyId"] in team_ids
+        }
+        df_teams_match = pd.DataFrame([teams[team_id] for team_id in team_ids])
         return cast(DataFrame[WyscoutTeamSchema], _convert_teams(df_teams_match))
 
     def players(self, game_id: int) -> DataFrame[WyscoutPlayerSchema]:
@@ -311,7 +336,9 @@ class PublicWyscoutLoader(EventDataLoader):
             # avoid that this large json file has to be parsed again for
             # each game when loading a batch of games from the same season
             self._cache = {"path": path, "events": df_events}
-        match_events = df_events.loc[game_id].reset_index().to_dict("records")
+        # only the period and timestamp of each event are needed to compute
+        # the minutes played; don't convert the other columns to records
+        match_events = df_events.loc[game_id, ["matchPeriod", "eventSec"]].to_dict("records")
         mp = _get_minutes_played(lineups, match_events)
         df_players_match = pd.merge(df_players_match, mp, on="player_id", how="right")
         df_players_match["minutes_played"] = df_players_match.minutes_played.fillna(0)
@@ -666,9 +693,9 @@ def _convert_competitions(competitions: pd.DataFrame) -> pd.DataFrame:
         "gender": "competition_gender",
     }
     cols = ["competition_id", "competition_name", "country_name", "competition_gender"]
-    competitions["country_name"] = competitions.apply(
-        lambda x: x.area["name"] if x.area["name"] != "" else "International", axis=1
-    )
+    competitions["country_name"] = [
+        area["name"] if area["name"] != "" else "International" for area in competitions["area"]
+    ]
     competitions = competitions.rename(columns=competitionsmapping)[cols]
     return competitions
 
@@ -695,8 +722,8 @@ def _convert_games(matches: pd.DataFrame) -> pd.DataFrame:
     cols = ["game_id", "competition_id", "season_id", "game_date", "game_day"]
     games = matches.rename(columns=gamesmapping)[cols]
     games["game_date"] = pd.to_datetime(games["game_date"])
-    games["home_team_id"] = matches.teamsData.apply(lambda x: _get_team_id(x, "home"))
-    games["away_team_id"] = matches.teamsData.apply(lambda x: _get_team_id(x, "away"))
+    games["home_team_id"] = [_get_team_id(x, "home") for x in matches["teamsData"]]
+    games["away_team_id"] = [_get_team_id(x, "away") for x in matches["teamsData"]]
     return games
 
 
@@ -717,7 +744,7 @@ def _convert_players(players: pd.DataFrame) -> pd.DataFrame:
     }
     cols = ["player_id", "nickname", "firstname", "lastname", "birth_date"]
     df_players = players.rename(columns=playermapping)[cols]
-    df_players["player_name"] = df_players[["firstname", "lastname"]].agg(" ".join, axis=1)
+    df_players["player_name"] = df_players["firstname"] + " " + df_players["lastname"]
     df_players["birth_date"] = pd.to_datetime(df_players["birth_date"])
     return df_players
 
@@ -774,7 +801,7 @@ def _convert_events(raw_events: pd.DataFrame) -> pd.DataFrame:
         .astype(int)
     )
     del events["sub_event_id"]
-    events["period_id"] = events.match_period.apply(lambda x: wyscout_periods[x])
+    events["period_id"] = events.match_period.map(wyscout_periods)
     events["milliseconds"] = events.event_sec * 1000
     return events.rename(columns=eventmapping)[cols]
 
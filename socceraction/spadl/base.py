@@ -9,23 +9,31 @@ import pandas as pd  # type: ignore
 
 from . import config as spadlconfig
 
+_actiontype_ids = {name: i for i, name in enumerate(spadlconfig.actiontypes)}
+_result_ids = {name: i for i, name in enumerate(spadlconfig.results)}
+_bodypart_ids = {name: i for i, name in enumerate(spadlconfig.bodyparts)}
+
 
 def _fix_clearances(actions: pd.DataFrame) -> pd.DataFrame:
-    next_actions = actions.shift(-1)
-    next_actions[-1:] = actions[-1:]
-    clearance_idx = actions.type_id == spadlconfig.actiontypes.index("clearance")
-    actions.loc[clearance_idx, "end_x"] = next_actions[clearance_idx].start_x.values
-    actions.loc[clearance_idx, "end_y"] = next_actions[clearance_idx].start_y.values
+    # only the start location of the next action is needed; shifting just
+    # those two columns avoids copying the entire frame
+    next_start = actions[["start_x", "start_y"]].shift(-1)
+    next_start[-1:] = actions[["start_x", "start_y"]][-1:]
+    clearance_idx = actions.type_id == _actiontype_ids["clearance"]
+    actions.loc[clearance_idx, "end_x"] = next_start[clearance_idx].start_x.values
+    actions.loc[clearance_idx, "end_y"] = next_start[clearance_idx].start_y.values
 
     return actions
 
 
 def _fix_direction_of_play(actions: pd.DataFrame, home_team_id: int) -> pd.DataFrame:
     away_idx = (actions.team_id != home_team_id).values
-    for col in ["start_x", "end_x"]:
-        actions.loc[away_idx, col] = spadlconfig.field_length - actions[away_idx][col].values
-    for col in ["start_y", "end_y"]:
-        actions.loc[away_idx, col] = spadlconfig.field_width - actions[away_idx][col].values
+    actions.loc[away_idx, ["start_x", "end_x"]] = (
+        spadlconfig.field_length - actions.loc[away_idx, ["start_x", "end_x"]].values
+    )
+    actions.loc[away_idx, ["start_y", "end_y"]] = (
+        spadlconfig.field_width - actions.loc[away_idx, ["start_y", "end_y"]].values
+    )
 
     return actions
 
@@ -39,12 +47,10 @@ def _add_dribbles(actions: pd.DataFrame) -> pd.DataFrame:
     next_actions = actions.shift(-1, fill_value=0)
 
     same_team = actions.team_id == next_actions.team_id
-    # not_clearance = actions.type_id != actiontypes.index("clearance")
-    not_offensive_foul = same_team & (
-        next_actions.type_id != spadlconfig.actiontypes.index("foul")
-    )
-    not_headed_shot = (next_actions.type_id != spadlconfig.actiontypes.index("shot")) & (
-        next_actions.bodypart_id != spadlconfig.bodyparts.index("head")
+    # not_clearance = actions.type_id != _actiontype_ids["clearance"]
+    not_offensive_foul = same_team & (next_actions.type_id != _actiontype_ids["foul"])
+    not_headed_shot = (next_actions.type_id != _actiontype_ids["shot"]) & (
+        next_actions.bodypart_id != _bodypart_ids["head"]
     )
 
     dx = actions.end_x - next_actions.start_x
@@ -81,9 +87,9 @@ def _add_dribbles(actions: pd.DataFrame) -> pd.DataFrame:
     dribbles["start_y"] = prev.end_y
     dribbles["end_x"] = nex.start_x
     dribbles["end_y"] = nex.start_y
-    dribbles["bodypart_id"] = spadlconfig.bodyparts.index("foot")
-    dribbles["type_id"] = spadlconfig.actiontypes.index("dribble")
-    dribbles["result_id"] = spadlconfig.results.index("success")
+    dribbles["bodypart_id"] = _bodypart_ids["foot"]
+    dribbles["type_id"] = _actiontype_ids["dribble"]
+    dribbles["result_id"] = _result_ids["success"]
 
     actions = pd.concat([actions, dribbles], ignore_index=True, sort=False)
     actions = actions.sort_values(["game_id", "period_id", "action_id"]).reset_index(drop=True)
@@ -96,30 +96,38 @@ def convert_to_actions(
         ),
     )
 
-    # Convert the events to SPADL actions
-    actions = []
-    for event in new_dataset.events:
-        action = dict(
-            game_id=game_id,
-            original_event_id=event.event_id,
-            period_id=event.period.id,
-            time_seconds=event.timestamp.total_seconds(),
-            team_id=event.team.team_id if event.team else None,
-            player_id=event.player.player_id if event.player else None,
-            start_x=event.coordinates.x if event.coordinates else None,
-            start_y=event.coordinates.y if event.coordinates else None,
-            **_get_end_location(event),
-            **_parse_event(event),
-        )
-        actions.append(action)
+    # Convert the events to SPADL actions; build one list per column instead
+    # of a dict per event to avoid the per-row dict allocations and the
+    # subsequent row-to-column transposition in the DataFrame constructor.
+    # Events without a parser (substitutions, cards, ...) would be converted
+    # to non-actions and dropped afterwards, so skip them up front. Sorting
+    # the (nearly ordered) event list is cheaper than a stable DataFrame sort
+    # afterwards.
+    events = sorted(
+        (event for event in new_dataset.events if event.event_type in _event_parsers),
+        key=lambda event: (event.period.id, event.timestamp),
+    )
+    end_locations = [_get_end_location(event) for event in events]
+    parsed_events = [_parse_event(event) for event in events]
+    columns = {
+        "game_id": [game_id] * len(events),
+        "original_event_id": [event.event_id for event in events],
+        "period_id": [event.period.id for event in events],
+        "time_seconds": [event.timestamp.total_seconds() for event in events],
+        "team_id": [event.team.team_id if event.team else None for event in events],
+        "player_id": [event.player.player_id if event.player else None for event in events],
+        "start_x": [event.coordinates.x if event.coordinates else None for event in events],
+        "start_y": [event.coordinates.y if event.coordinates else None for event in events],
+        "end_x": [loc["end_x"] for loc in end_locations],
+        "end_y": [loc["end_y"] for loc in end_locations],
+        "type_id": [action["type_id"] for action in parsed_events],
+        "result_id": [action["result_id"] for action in parsed_events],
+        "bodypart_id": [action["bodypart_id"] for action in parsed_events],
+    }
 
     # Create the SPADL actions DataFrame
-    df_actions = (
-        pd.DataFrame(actions)
-        .sort_values(["game_id", "period_id", "time_seconds"], kind="mergesort")
-        .reset_index(drop=True)
-    )
-    df_actions = df_actions[df_actions.type_id != spadlconfig.actiontypes.index("non_action")]
+    df_actions = pd.DataFrame(columns)
+    df_actions = df_actions[df_actions.type_id != _actiontype_ids["non_action"]]
 
     df_actions = _fix_clearances(df_actions)
 
@@ -177,57 +185,49 @@ def _get_end_location(event: Event) -> dict[str, Optional[float]]:
     return {"end_x": None, "end_y": None}
 
 
+# lookup tables mapping SPADL names to their IDs; avoids an O(n) list.index
+# scan for each parsed event
+_actiontype_ids = {name: i for i, name in enumerate(spadlconfig.actiontypes)}
+_result_ids = {name: i for i, name in enumerate(spadlconfig.results)}
+_bodypart_ids = {name: i for i, name in enumerate(spadlconfig.bodyparts)}
+
+
 def _parse_event(event: Event) -> dict[str, int]:
-    events = {
-        EventType.PASS: _parse_pass_event,
-        EventType.SHOT: _parse_shot_event,
-        EventType.TAKE_ON: _parse_take_on_event,
-        EventType.CARRY: _parse_carry_event,
-        EventType.FOUL_COMMITTED: _parse_foul_event,
-        EventType.DUEL: _parse_duel_event,
-        EventType.CLEARANCE: _parse_clearance_event,
-        EventType.MISCONTROL: _parse_miscontrol_event,
-        EventType.GOALKEEPER: _parse_goalkeeper_event,
-        EventType.INTERCEPTION: _parse_interception_event,
-        # other non-action events
-        # EventType.GENERIC: _parse_event_as_non_action,
-        # EventType.RECOVERY: _parse_event_as_non_action,
-        # EventType.SUBSTITUTION: _parse_event_as_non_action,
-        # EventType.CARD: _parse_event_as_non_action,
-        # EventType.PLAYER_ON: _parse_event_as_non_action,
-        # EventType.PLAYER_OFF: _parse_event_as_non_action,
-        # EventType.BALL_OUT: _parse_event_as_non_action,
-        # EventType.FORMATION_CHANGE:_parse_event_as_non_action,
-    }
-    parser = events.get(event.event_type, _parse_event_as_non_action)
+    parser = _event_parsers.get(event.event_type, _parse_event_as_non_action)
     a, r, b = parser(event)
     return {
-        "type_id": spadlconfig.actiontypes.index(a),
-        "result_id": spadlconfig.results.index(r),
-        "bodypart_id": spadlconfig.bodyparts.index(b),
+        "type_id": _actiontype_ids[a],
+        "result_id": _result_ids[r],
+        "bodypart_id": _bodypart_ids[b],
     }
 
 
-def _qualifiers(event: Event) -> list[Qualifier]:
+_no_qualifiers: frozenset[Qualifier] = frozenset()
+
+
+def _qualifiers(event: Event) -> frozenset[Qualifier]:
+    # the parsers only test membership, so return a set for O(1) lookups
     if event.qualifiers:
-        return [q.value for q in event.qualifiers]
-    return []
-
-
-def _parse_bodypart(qualifiers: list[Qualifier], default: str = "foot") -> str:
-    if BodyPart.HEAD in qualifiers:
-        b = "head"
-    elif BodyPart.RIGHT_FOOT in qualifiers:
-        b = "foot_right"
-    elif BodyPart.LEFT_FOOT in qualifiers:
-        b = "foot_left"
-    elif BodyPart.CHEST in qualifiers or BodyPart.OTHER in qualifiers:
-        b = "other"
-    elif BodyPart.HEAD_OTHER in qualifiers:
-        b = "head/other"
-    else:
-        b = default
-    return b
+        return frozenset(q.value for q in event.qualifiers)
+    return _no_qualifiers
+
+
+# body part qualifiers mapped to their SPADL name, in priority order
+_bodypart_names = (
+    (BodyPart.HEAD, "head"),
+    (BodyPart.RIGHT_FOOT, "foot_right"),
+    (BodyPart.LEFT_FOOT, "foot_left"),
+    (BodyPart.CHEST, "other"),
+    (BodyPart.OTHER, "other"),
+    (BodyPart.HEAD_OTHER, "head/other"),
+)
+
+
+def _parse_bodypart(qualifiers: frozenset[Qualifier], default: str = "foot") -> str:
+    for bodypart, name in _bodypart_names:
+        if bodypart in qualifiers:
+            return name
+    return default
 
 
 def _parse_event_as_non_action(event: Event) -> tuple[str, str, str]:
@@ -237,6 +237,12 @@ def _parse_event_as_non_action(event: Event) -> tuple[str, str, str]:
     return a, r, b
 
 
+# pass qualifiers that turn a free kick or corner into a crossed variant
+_crossed_pass_qualifiers = frozenset(
+    {PassType.CHIPPED_PASS, PassType.CROSS, PassType.HIGH_PASS, PassType.LONG_BALL}
+)
+
+
 def _parse_pass_event(event: PassEvent) -> tuple[str, str, str]:  # noqa: C901
     qualifiers = _qualifiers(event)
     b = _parse_bodypart(qualifiers)
@@ -244,22 +250,12 @@ def _parse_pass_event(event: PassEvent) -> tuple[str, str, str]:  # noqa: C901
     a = "pass"  # default
     r = None
     if SetPieceType.FREE_KICK in qualifiers:
-        if (
-            PassType.CHIPPED_PASS in qualifiers
-            or PassType.CROSS in qualifiers
-            or PassType.HIGH_PASS in qualifiers
-            or PassType.LONG_BALL in qualifiers
-        ):
+        if not _crossed_pass_qualifiers.isdisjoint(qualifiers):
             a = "freekick_crossed"
         else:
             a = "freekick_short"
     elif SetPieceType.CORNER_KICK in qualifiers:
-        if (
-            PassType.CHIPPED_PASS in qualifiers
-            or PassType.CROSS in qualifiers
-            or PassType.HIGH_PASS in qualifiers
-            or PassType.LONG_BALL in qualifiers
-        ):
+        if not _crossed_pass_qualifiers.isdisjoint(qualifiers):
             a = "corner_crossed"
         else:
             a = "corner_short"
@@ -418,3 +414,26 @@ def _parse_goalkeeper_event(event: GoalkeeperEvent) -> tuple[str, str, str]:
         pass
 
     return a, r, b
+
+
+_event_parsers = {
+    EventType.PASS: _parse_pass_event,
+    EventType.SHOT: _parse_shot_event,
+    EventType.TAKE_ON: _parse_take_on_event,
+    EventType.CARRY: _parse_carry_event,
+    EventType.FOUL_COMMITTED: _parse_foul_event,
+    EventType.DUEL: _parse_duel_event,
+    EventType.CLEARANCE: _parse_clearance_event,
+    EventType.MISCONTROL: _parse_miscontrol_event,
+    EventType.GOALKEEPER: _parse_goalkeeper_event,
+    EventType.INTERCEPTION: _parse_interception_event,
+    # other non-action events
+    # EventType.GENERIC: _parse_event_as_non_action,
+    # EventType.RECOVERY: _parse_event_as_non_action,
+    # EventType.SUBSTITUTION: _parse_event_as_non_action,
+    # EventType.CARD: _parse_event_as_non_action,
+    # EventType.PLAYER_ON: _parse_event_as_non_action,
+    # EventType.PLAYER_OFF: _parse_event_as_non_action,
+    # EventType.BALL_OUT: _parse_event_as_non_action,
+    # EventType.FORMATION_CHANGE:_parse_event_as_non_action,
+}
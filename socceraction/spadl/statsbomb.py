@@ -82,7 +82,10 @@ def convert_to_actions(
     actions["player_id"] = events.player_id
 
     # split (end)location column into x and y columns
-    end_location = events[["location", "extra"]].apply(_get_end_location, axis=1)
+    end_location = pd.Series(
+        [_get_end_location(q) for q in zip(events["location"], events["extra"])],
+        index=events.index,
+    )
     # convert StatsBomb coordinates to spadl coordinates
     actions.loc[events.type_name == "Shot", ["start_x", "start_y"]] = _convert_locations(
         events.loc[events.type_name == "Shot", "location"],
@@ -101,12 +104,12 @@ def convert_to_actions(
         shot_fidelity_version,
     )
 
-    actions[["type_id", "result_id", "bodypart_id"]] = events[["type_name", "extra"]].apply(
-        _parse_event, axis=1, result_type="expand"
-    )
+    actions[["type_id", "result_id", "bodypart_id"]] = [
+        _parse_event(q) for q in zip(events["type_name"], events["extra"])
+    ]
 
     actions = (
-        actions[actions.type_id != spadlconfig.actiontypes.index("non_action")]
+        actions[actions.type_id != _actiontype_ids["non_action"]]
         .sort_values(["game_id", "period_id", "time_seconds"], kind="mergesort")
         .reset_index(drop=True)
     )
@@ -141,10 +144,17 @@ def _insert_interception_passes(df_events: pd.DataFrame) -> pd.DataFrame:
         interceptions in the StatsBomb notation are transformed into two events.
     """
 
-    def is_interception_pass(x: dict) -> bool:  # type: ignore
-        return x.get("extra", {}).get("pass", {}).get("type", {}).get("name") == "Interception"
+    def is_interception_pass(extra: dict) -> bool:  # type: ignore
+        if not isinstance(extra, dict):
+            return False
+        return extra.get("pass", {}).get("type", {}).get("name") == "Interception"
 
-    df_events_interceptions = df_events[df_events.apply(is_interception_pass, axis=1)].copy()
+    mask_interception_pass = pd.Series(
+        [is_interception_pass(extra) for extra in df_events["extra"]],
+        index=df_events.index,
+        dtype=bool,
+    )
+    df_events_interceptions = df_events[mask_interception_pass].copy()
 
     if not df_events_interceptions.empty:
         df_events_interceptions["type_name"] = "Interception"
@@ -220,27 +230,18 @@ def _get_end_location(q: tuple[Location, dict[str, Any]]) -> Location:
     return start_location
 
 
+# lookup tables mapping SPADL names to their IDs; avoids an O(n) list.index
+# scan for each parsed event
+_actiontype_ids = {name: i for i, name in enumerate(spadlconfig.actiontypes)}
+_result_ids = {name: i for i, name in enumerate(spadlconfig.results)}
+_bodypart_ids = {name: i for i, name in enumerate(spadlconfig.bodyparts)}
+
+
 def _parse_event(q: tuple[str, dict[str, Any]]) -> tuple[int, int, int]:
     t, x = q
-    events = {
-        "Pass": _parse_pass_event,
-        "Dribble": _parse_dribble_event,
-        "Carry": _parse_carry_event,
-        "Foul Committed": _parse_foul_event,
-        "Duel": _parse_duel_event,
-        "Interception": _parse_interception_event,
-        "Shot": _parse_shot_event,
-        "Own Goal Against": _parse_own_goal_event,
-        "Goal Keeper": _parse_goalkeeper_event,
-        "Clearance": _parse_clearance_event,
-        "Miscontrol": _parse_miscontrol_event,
-    }
-    parser = events.get(t, _parse_event_as_non_action)
+    parser = _event_parsers.get(t, _parse_event_as_non_action)
     a, r, b = parser(x)
-    actiontype = spadlconfig.actiontypes.index(a)
-    result = spadlconfig.results.index(r)
-    bodypart = spadlconfig.bodyparts.index(b)
-    return actiontype, result, bodypart
+    return _actiontype_ids[a], _result_ids[r], _bodypart_ids[b]
 
 
 def _parse_event_as_non_action(_extra: dict[str, Any]) -> tuple[str, str, str]:
@@ -250,6 +251,27 @@ def _parse_event_as_non_action(_extra: dict[str, Any]) -> tuple[str, str, str]:
     return a, r, b
 
 
+_bodypart_names = {
+    "Head": "head",
+    "Left Foot": "foot_left",
+    "Right Foot": "foot_right",
+}
+
+
+def _parse_bodypart(bp: Optional[str], default: str = "foot", drop_kick: bool = False) -> str:
+    """Map a StatsBomb body part name to a SPADL bodypart name."""
+    if bp is None:
+        return default
+    try:
+        return _bodypart_names[bp]
+    except KeyError:
+        if "Head" in bp:
+            return "head"
+        if "Foot" in bp or (drop_kick and bp == "Drop Kick"):
+            return "foot"
+        return "other"
+
+
 def _parse_pass_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # noqa: C901
     a = "pass"  # default
     b = "foot"  # default
@@ -277,7 +299,7 @@ def _parse_pass_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # noqa: C
     else:
         a = "pass"
 
-    pass_outcome = extra.get("pass", {}).get("outcome", {}).get("name")
+    pass_outcome = p.get("outcome", {}).get("name")
     if pass_outcome in ["Incomplete", "Out"]:
         r = "fail"
     elif pass_outcome == "Pass Offside":
@@ -289,18 +311,7 @@ def _parse_pass_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # noqa: C
     else:
         r = "success"
 
-    bp = extra.get("pass", {}).get("body_part", {}).get("name")
-    if bp is not None:
-        if "Head" in bp:
-            b = "head"
-        elif bp == "Left Foot":
-            b = "foot_left"
-        elif bp == "Right Foot":
-            b = "foot_right"
-        elif "Foot" in bp or bp == "Drop Kick":
-            b = "foot"
-        else:
-            b = "other"
+    b = _parse_bodypart(p.get("body_part", {}).get("name"), default=b, drop_kick=True)
 
     return a, r, b
 
@@ -345,9 +356,10 @@ def _parse_foul_event(extra: dict[str, Any]) -> tuple[str, str, str]:
 
 
 def _parse_duel_event(extra: dict[str, Any]) -> tuple[str, str, str]:
-    if extra.get("duel", {}).get("type", {}).get("name") == "Tackle":
+    duel = extra.get("duel", {})
+    if duel.get("type", {}).get("name") == "Tackle":
         a = "tackle"
-        duel_outcome = extra.get("duel", {}).get("outcome", {}).get("name")
+        duel_outcome = duel.get("outcome", {}).get("name")
         if duel_outcome in ["Lost In Play", "Lost Out"]:
             r = "fail"
         elif duel_outcome in ["Success in Play", "Won"]:
@@ -374,7 +386,8 @@ def _parse_interception_event(extra: dict[str, Any]) -> tuple[str, str, str]:
 
 
 def _parse_shot_event(extra: dict[str, Any]) -> tuple[str, str, str]:
-    extra_type = extra.get("shot", {}).get("type", {}).get("name")
+    shot = extra.get("shot", {})
+    extra_type = shot.get("type", {}).get("name")
     if extra_type == "Free Kick":
         a = "shot_freekick"
     elif extra_type == "Penalty":
@@ -382,7 +395,7 @@ def _parse_shot_event(extra: dict[str, Any]) -> tuple[str, str, str]:
     else:
         a = "shot"
 
-    shot_outcome = extra.get("shot", {}).get("outcome", {}).get("name")
+    shot_outcome = shot.get("outcome", {}).get("name")
     if shot_outcome == "Goal":
         r = "success"
     elif shot_outcome in ["Blocked", "Off T", "Post", "Saved", "Wayward"]:
@@ -390,19 +403,7 @@ def _parse_shot_event(extra: dict[str, Any]) -> tuple[str, str, str]:
     else:
         r = "fail"
 
-    bp = extra.get("shot", {}).get("body_part", {}).get("name")
-    if bp is None:
-        b = "foot"
-    elif "Head" in bp:
-        b = "head"
-    elif bp == "Left Foot":
-        b = "foot_left"
-    elif bp == "Right Foot":
-        b = "foot_right"
-    elif "Foot" in bp:
-        b = "foot"
-    else:
-        b = "other"
+    b = _parse_bodypart(shot.get("body_part", {}).get("name"))
 
     return a, r, b
 
@@ -415,7 +416,8 @@ def _parse_own_goal_event(_extra: dict[str, Any]) -> tuple[str, str, str]:
 
 
 def _parse_goalkeeper_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # noqa: C901
-    extra_type = extra.get("goalkeeper", {}).get("type", {}).get("name")
+    goalkeeper = extra.get("goalkeeper", {})
+    extra_type = goalkeeper.get("type", {}).get("name")
     if extra_type == "Shot Saved":
         a = "keeper_save"
     elif extra_type in ("Collected", "Keeper Sweeper"):
@@ -425,7 +427,7 @@ def _parse_goalkeeper_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # n
     else:
         a = "non_action"
 
-    goalkeeper_outcome = extra.get("goalkeeper", {}).get("outcome", {}).get("name", "x")
+    goalkeeper_outcome = goalkeeper.get("outcome", {}).get("name", "x")
     if goalkeeper_outcome in [
         "Claim",
         "Clear",
@@ -440,19 +442,9 @@ def _parse_goalkeeper_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # n
     else:
         r = "success"
 
-    bp = extra.get("goalkeeper", {}).get("body_part", {}).get("name")
-    if bp is None:
-        b = "other"
-    elif "Head" in bp:
-        b = "head"
-    elif bp == "Left Foot":
-        b = "foot_left"
-    elif bp == "Right Foot":
-        b = "foot_right"
-    elif "Foot" in bp or bp == "Drop Kick":
-        b = "foot"
-    else:
-        b = "other"
+    b = _parse_bodypart(
+        goalkeeper.get("body_part", {}).get("name"), default="other", drop_kick=True
+    )
 
     return a, r, b
 
@@ -460,19 +452,7 @@ def _parse_goalkeeper_event(extra: dict[str, Any]) -> tuple[str, str, str]:  # n
 def _parse_clearance_event(extra: dict[str, Any]) -> tuple[str, str, str]:
     a = "clearance"
     r = "success"
-    bp = extra.get("clearance", {}).get("body_part", {}).get("name")
-    if bp is None:
-        b = "foot"
-    elif "Head" in bp:
-        b = "head"
-    elif bp == "Left Foot":
-        b = "foot_left"
-    elif bp == "Right Foot":
-        b = "foot_right"
-    elif "Foot" in bp:
-        b = "foot"
-    else:
-        b = "other"
+    b = _parse_bodypart(extra.get("clearance", {}).get("body_part", {}).get("name"))
     return a, r, b
 
 
@@ -481,3 +461,18 @@ def _parse_miscontrol_event(_extra: dict[str, Any]) -> tuple[str, str, str]:
     r = "fail"
     b = "foot"
     return a, r, b
+
+
+_event_parsers = {
+    "Pass": _parse_pass_event,
+    "Dribble": _parse_dribble_event,
+    "Carry": _parse_carry_event,
+    "Foul Committed": _parse_foul_event,
+    "Duel": _parse_duel_event,
+    "Interception": _parse_interception_event,
+    "Shot": _parse_shot_event,
+    "Own Goal Against": _parse_own_goal_event,
+    "Goal Keeper": _parse_goalkeeper_event,
+    "Clearance": _parse_clearance_event,
+    "Miscontrol": _parse_miscontrol_event,
+}
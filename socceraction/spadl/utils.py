@@ -2,6 +2,7 @@
 
 from typing import cast
 
+import pandas as pd  # type: ignore
 from pandera.typing import DataFrame
 
 from . import config as spadlconfig
@@ -22,14 +23,21 @@ def add_names(actions: DataFrame[SPADLSchema]) -> DataFrame[SPADLSchema]:
         The original dataframe with a 'type_name', 'result_name' and
         'bodypart_name' appended.
     """
-    return cast(
-        DataFrame[SPADLSchema],
-        actions.drop(columns=["type_name", "result_name", "bodypart_name"], errors="ignore")
-        .merge(spadlconfig.actiontypes_df(), how="left")
-        .merge(spadlconfig.results_df(), how="left")
-        .merge(spadlconfig.bodyparts_df(), how="left")
-        .set_index(actions.index),
+    named_actions = actions.drop(
+        columns=["type_name", "result_name", "bodypart_name"], errors="ignore"
     )
+    # the id columns index directly into the config lists, so the names can be
+    # added as categoricals (cheaper than a merge and ~8x smaller in memory)
+    named_actions["type_name"] = pd.Categorical.from_codes(
+        named_actions["type_id"], categories=spadlconfig.actiontypes
+    )
+    named_actions["result_name"] = pd.Categorical.from_codes(
+        named_actions["result_id"], categories=spadlconfig.results
+    )
+    named_actions["bodypart_name"] = pd.Categorical.from_codes(
+        named_actions["bodypart_id"], categories=spadlconfig.bodyparts
+    )
+    return cast(DataFrame[SPADLSchema], named_actions)
 
 
 def play_left_to_right(
@@ -2,6 +2,7 @@
 
 from typing import Any, Optional, cast
 
+import numpy as np
 import pandas as pd  # type: ignore
 from pandera.typing import DataFrame
 
@@ -14,6 +15,10 @@ from .base import (
 )
 from .schema import SPADLSchema
 
+_actiontype_ids = {name: i for i, name in enumerate(spadlconfig.actiontypes)}
+_result_ids = {name: i for i, name in enumerate(spadlconfig.results)}
+_bodypart_ids = {name: i for i, name in enumerate(spadlconfig.bodyparts)}
+
 ###################################
 # WARNING: HERE BE DRAGONS
 # This code for converting wyscout data was organically grown over a long period of time.
@@ -69,11 +74,11 @@ def get_tagsdf(events: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         A dataframe with a column for each tag.
     """
-    tags = events.tags.apply(_get_tag_set)
-    tagsdf = pd.DataFrame()
-    for tag_id, column in wyscout_tags:
-        tagsdf[column] = tags.apply(lambda x, tag=tag_id: tag in x)
-    return tagsdf
+    tags = [_get_tag_set(event_tags) for event_tags in events["tags"]]
+    return pd.DataFrame(
+        {column: [tag_id in tag_set for tag_set in tags] for tag_id, column in wyscout_tags},
+        index=events.index,
+    )
 
 
 wyscout_tags = [
@@ -139,23 +144,14 @@ wyscout_tags = [
 ]
 
 
-def _make_position_vars(event_id: int, positions: list[dict[str, Optional[float]]]) -> pd.Series:
+def _get_position_coordinates(
+    positions: list[dict[str, Optional[float]]],
+) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
     if len(positions) == 2:  # if less than 2 then action is removed
-        start_x = positions[0]["x"]
-        start_y = positions[0]["y"]
-        end_x = positions[1]["x"]
-        end_y = positions[1]["y"]
-    elif len(positions) == 1:
-        start_x = positions[0]["x"]
-        start_y = positions[0]["y"]
-        end_x = start_x
-        end_y = start_y
-    else:
-        start_x = None
-        start_y = None
-        end_x = None
-        end_y = None
-    return pd.Series([event_id, start_x, start_y, end_x, end_y])
+        return positions[0]["x"], positions[0]["y"], positions[1]["x"], positions[1]["y"]
+    if len(positions) == 1:
+        return positions[0]["x"], positions[0]["y"], positions[0]["x"], positions[0]["y"]
+    return None, None, None, None
 
 
 def make_new_positions(events: pd.DataFrame) -> pd.DataFrame:
@@ -171,14 +167,11 @@ def make_new_positions(events: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Wyscout event dataframe with start and end coordinates for each action.
     """
-    new_positions = events[["event_id", "positions"]].apply(
-        lambda row: _make_position_vars(row["event_id"], row["positions"]), axis=1
-    )
-    new_positions.columns = ["event_id", "start_x", "start_y", "end_x", "end_y"]
-    events = pd.merge(events, new_positions, left_on="event_id", right_on="event_id")
-    events[["start_x", "end_x"]] = events[["start_x", "end_x"]].astype(float)
-    events[["start_y", "end_y"]] = events[["start_y", "end_y"]].astype(float)
+    coordinates = [_get_position_coordinates(positions) for positions in events["positions"]]
     events = events.drop("positions", axis=1)
+    events[["start_x", "start_y", "end_x", "end_y"]] = pd.DataFrame(
+        coordinates, index=events.index, dtype=float
+    )
     return events
 
 
@@ -580,44 +573,46 @@ def create_df_actions(df_events: pd.DataFrame) -> pd.DataFrame:
         ]
     ].copy()
     df_actions["original_event_id"] = df_events["event_id"].astype(object)
-    df_actions["bodypart_id"] = df_events.apply(determine_bodypart_id, axis=1)
-    df_actions["type_id"] = df_events.apply(determine_type_id, axis=1)
-    df_actions["result_id"] = df_events.apply(determine_result_id, axis=1)
+    df_actions["bodypart_id"] = determine_bodypart_id(df_events)
+    # classify the type and result in a single pass over plain dict records
+    # instead of two row-wise applies
+    records = df_events.to_dict("records")
+    df_actions["type_id"] = [determine_type_id(event) for event in records]
+    df_actions["result_id"] = [determine_result_id(event) for event in records]
 
     df_actions = remove_non_actions(df_actions)  # remove all non-actions left
 
     return df_actions
 
 
-def determine_bodypart_id(event: pd.DataFrame) -> int:
-    """Determint eht body part for each action.
+def determine_bodypart_id(events: pd.DataFrame) -> np.ndarray:
+    """Determine the body part for each action.
 
     Parameters
     ----------
-    event : pd.Series
-        Wyscout event Series
+    events : pd.DataFrame
+        Wyscout event dataframe
 
     Returns
     -------
-    int
-        id of the body part used for the action
+    np.ndarray
+        id of the body part used for each action
     """
-    if event["subtype_id"] in [81, 36, 21, 90, 91]:
-        body_part = "other"
-    elif event["subtype_id"] == 82:
-        body_part = "head"
-    elif event["type_id"] == 10 and event["head/body"]:
-        body_part = "head/other"
-    elif event["left_foot"]:
-        body_part = "foot_left"
-    elif event["right_foot"]:
-        body_part = "foot_right"
-    else:  # all other cases
-        body_part = "foot"
-    return spadlconfig.bodyparts.index(body_part)
-
-
-def determine_type_id(event: pd.DataFrame) -> int:  # noqa: C901
+    conditions = [
+        events["subtype_id"].isin([81, 36, 21, 90, 91]),
+        events["subtype_id"] == 82,
+        (events["type_id"] == 10) & events["head/body"],
+        events["left_foot"],
+        events["right_foot"],
+    ]
+    choices = [
+        _bodypart_ids[body_part]
+        for body_part in ("other", "head", "head/other", "foot_left", "foot_right")
+    ]
+    return np.select(conditions, choices, default=_bodypart_ids["foot"])
+
+
+def determine_type_id(event: dict[str, Any]) -> int:  # noqa: C901
     """Determine the type of each action.
 
     This function transforms the Wyscout events, sub_events and tags
@@ -625,8 +620,8 @@ def determine_type_id(event: pd.DataFrame) -> int:  # noqa: C901
 
     Parameters
     ----------
-    event : pd.Series
-        A series from the Wyscout event dataframe
+    event : dict
+        A record from the Wyscout event dataframe
 
     Returns
     -------
@@ -679,16 +674,16 @@ def determine_type_id(event: pd.DataFrame) -> int:  # noqa: C901
         action_type = "interception"
     else:
         action_type = "non_action"
-    return spadlconfig.actiontypes.index(action_type)
+    return _actiontype_ids[action_type]
 
 
-def determine_result_id(event: pd.DataFrame) -> int:  # noqa: C901
+def determine_result_id(event: dict[str, Any]) -> int:  # noqa: C901
     """Determine the result of each event.
 
     Parameters
     ----------
-    event : pd.Series
-        Wyscout event Series
+    event : dict
+        A record from the Wyscout event dataframe
 
     Returns
     -------
@@ -736,7 +731,7 @@ def remove_non_actions(df_actions: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         SciSports action dataframe without non-actions
     """
-    df_actions = df_actions[df_actions["type_id"] != spadlconfig.actiontypes.index("non_action")]
+    df_actions = df_actions[df_actions["type_id"] != _actiontype_ids["non_action"]]
     # remove remaining ball out of field, whistle and goalkeeper from line
     df_actions = df_actions.reset_index(drop=True)
     return df_actions
@@ -795,7 +790,7 @@ def fix_goalkick_coordinates(df_actions: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         SciSports action dataframe including start coordinates for goalkicks
     """
-    goalkicks_idx = df_actions["type_id"] == spadlconfig.actiontypes.index("goalkick")
+    goalkicks_idx = df_actions["type_id"] == _actiontype_ids["goalkick"]
     df_actions.loc[goalkicks_idx, "start_x"] = 5.0
     df_actions.loc[goalkicks_idx, "start_y"] = 34.0
 
@@ -817,7 +812,7 @@ def fix_foul_coordinates(df_actions: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         SciSports action dataframe including start coordinates for goalkicks
     """
-    fouls_idx = df_actions["type_id"] == spadlconfig.actiontypes.index("foul")
+    fouls_idx = df_actions["type_id"] == _actiontype_ids["foul"]
     df_actions.loc[fouls_idx, "end_x"] = df_actions.loc[fouls_idx, "start_x"]
     df_actions.loc[fouls_idx, "end_y"] = df_actions.loc[fouls_idx, "start_y"]
 
@@ -840,7 +835,7 @@ def fix_keeper_save_coordinates(df_actions: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         SciSports action dataframe with correct keeper_save coordinates
     """
-    saves_idx = df_actions["type_id"] == spadlconfig.actiontypes.index("keeper_save")
+    saves_idx = df_actions["type_id"] == _actiontype_ids["keeper_save"]
     # invert the coordinates
     df_actions.loc[saves_idx, "end_x"] = (
         spadlconfig.field_length - df_actions.loc[saves_idx, "end_x"]
@@ -872,17 +867,17 @@ def remove_keeper_goal_actions(df_actions: pd.DataFrame) -> pd.DataFrame:
     """
     prev_actions = df_actions.shift(1)
     same_phase = prev_actions.time_seconds + 10 > df_actions.time_seconds
-    shot_goals = (prev_actions.type_id == spadlconfig.actiontypes.index("shot")) & (
+    shot_goals = (prev_actions.type_id == _actiontype_ids["shot"]) & (
         prev_actions.result_id == 1
     )
-    penalty_goals = (prev_actions.type_id == spadlconfig.actiontypes.index("shot_penalty")) & (
+    penalty_goals = (prev_actions.type_id == _actiontype_ids["shot_penalty"]) & (
         prev_actions.result_id == 1
     )
-    freekick_goals = (prev_actions.type_id == spadlconfig.actiontypes.index("shot_freekick")) & (
+    freekick_goals = (prev_actions.type_id == _actiontype_ids["shot_freekick"]) & (
         prev_actions.result_id == 1
     )
     goals = shot_goals | penalty_goals | freekick_goals
-    keeper_save = df_actions["type_id"] == spadlconfig.actiontypes.index("keeper_save")
+    keeper_save = df_actions["type_id"] == _actiontype_ids["keeper_save"]
     goals_keepers_idx = same_phase & goals & keeper_save
     df_actions = df_actions.drop(df_actions.index[goals_keepers_idx])
     df_actions = df_actions.reset_index(drop=True)
@@ -907,7 +902,7 @@ def adjust_goalkick_result(df_actions: pd.DataFrame) -> pd.DataFrame:
         SciSports action dataframe with correct goalkick results
     """
     nex_actions = df_actions.shift(-1)
-    goalkicks = df_actions["type_id"] == spadlconfig.actiontypes.index("goalkick")
+    goalkicks = df_actions["type_id"] == _actiontype_ids["goalkick"]
     same_team = df_actions["team_id"] == nex_actions["team_id"]
     accurate = same_team & goalkicks
     not_accurate = ~same_team & goalkicks
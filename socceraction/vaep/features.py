@@ -89,10 +89,14 @@ def gamestates(actions: Actions, nb_prev_actions: int = 3) -> GameStates:
     if nb_prev_actions < 1:
         raise ValueError("The game state should include at least one preceding action.")
     states = [actions]
+    # the i-th previous action is the row i positions back, clipped to the
+    # first action of the same game and period; computing these positions
+    # directly avoids a Python-level apply per group
+    group_position = actions.groupby(["game_id", "period_id"], sort=False).cumcount().to_numpy()
+    row_position = np.arange(len(actions))
+    group_start = row_position - group_position
     for i in range(1, nb_prev_actions):
-        prev_actions = actions.groupby(["game_id", "period_id"], sort=False, as_index=False).apply(
-            lambda x: x.shift(i, fill_value=float("nan")).fillna(x.iloc[0])  # noqa: B023
-        )
+        prev_actions = actions.iloc[np.maximum(row_position - i, group_start)]
         prev_actions.index = actions.index.copy()
         states.append(prev_actions)  # type: ignore
     return states
@@ -615,10 +619,10 @@ def team(gamestates: GameStates) -> Features:
         whether the team that performed action a0 is in possession.
     """
     a0 = gamestates[0]
-    teamdf = pd.DataFrame(index=a0.index)
-    for i, a in enumerate(gamestates[1:]):
-        teamdf["team_" + (str(i + 1))] = a.team_id == a0.team_id
-    return teamdf
+    # collect the columns in a dict and build the frame once instead of
+    # triggering a column insertion per previous action
+    cols = {f"team_{i + 1}": a.team_id == a0.team_id for i, a in enumerate(gamestates[1:])}
+    return pd.DataFrame(cols, index=a0.index)
 
 
 def time_delta(gamestates: GameStates) -> Features:
@@ -636,10 +640,11 @@ def time_delta(gamestates: GameStates) -> Features:
         containing the number of seconds between action ai and action a0.
     """
     a0 = gamestates[0]
-    dt = pd.DataFrame(index=a0.index)
-    for i, a in enumerate(gamestates[1:]):
-        dt["time_delta_" + (str(i + 1))] = a0.time_seconds - a.time_seconds
-    return dt
+    cols = {
+        f"time_delta_{i + 1}": a0.time_seconds - a.time_seconds
+        for i, a in enumerate(gamestates[1:])
+    }
+    return pd.DataFrame(cols, index=a0.index)
 
 
 def space_delta(gamestates: GameStates) -> Features:
@@ -658,14 +663,14 @@ def space_delta(gamestates: GameStates) -> Features:
         <nb_prev_actions> action ai and action a0.
     """
     a0 = gamestates[0]
-    spaced = pd.DataFrame(index=a0.index)
+    cols = {}
     for i, a in enumerate(gamestates[1:]):
         dx = a.end_x - a0.start_x
-        spaced["dx_a0" + (str(i + 1))] = dx
         dy = a.end_y - a0.start_y
-        spaced["dy_a0" + (str(i + 1))] = dy
-        spaced["mov_a0" + (str(i + 1))] = np.sqrt(dx**2 + dy**2)
-    return spaced
+        cols[f"dx_a0{i + 1}"] = dx
+        cols[f"dy_a0{i + 1}"] = dy
+        cols[f"mov_a0{i + 1}"] = np.sqrt(dx**2 + dy**2)
+    return pd.DataFrame(cols, index=a0.index)
 
 
 def speed(gamestates: GameStates) -> Features:
@@ -684,16 +689,16 @@ def speed(gamestates: GameStates) -> Features:
         action ai and action a0.
     """
     a0 = gamestates[0]
-    speed = pd.DataFrame(index=a0.index)
+    cols = {}
     for i, a in enumerate(gamestates[1:]):
         dx = a.end_x - a0.start_x
         dy = a.end_y - a0.start_y
         dt = a0.time_seconds - a.time_seconds
         dt[dt <= 0] = 1e-6
-        speed["speedx_a0" + (str(i + 1))] = dx.abs() / dt
-        speed["speedy_a0" + (str(i + 1))] = dy.abs() / dt
-        speed["speed_a0" + (str(i + 1))] = np.sqrt(dx**2 + dy**2) / dt
-    return speed
+        cols[f"speedx_a0{i + 1}"] = dx.abs() / dt
+        cols[f"speedy_a0{i + 1}"] = dy.abs() / dt
+        cols[f"speed_a0{i + 1}"] = np.sqrt(dx**2 + dy**2) / dt
+    return pd.DataFrame(cols, index=a0.index)
 
 
 # CONTEXT FEATURES
@@ -716,12 +721,9 @@ def goalscore(gamestates: GameStates) -> Features:
     """
     actions = gamestates[0]
     teamA = actions["team_id"].values[0]
-    goals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadlcfg.results.index("success")
-    )
-    owngoals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadlcfg.results.index("owngoal")
-    )
+    shots = actions["type_name"].str.contains("shot")
+    goals = shots & (actions["result_id"] == spadlcfg.results.index("success"))
+    owngoals = shots & (actions["result_id"] == spadlcfg.results.index("owngoal"))
     teamisA = actions["team_id"] == teamA
     teamisB = ~teamisA
     goalsteamA = (goals & teamisA) | (owngoals & teamisB)
@@ -1,19 +1,30 @@
 """Implements the formula of the VAEP framework."""
 
+import numpy as np
 import pandas as pd  # type: ignore
 from pandera.typing import DataFrame, Series
 
+import socceraction.spadl.config as spadl
 from socceraction.spadl.schema import SPADLSchema
 
 
 def _prev(x: pd.Series) -> pd.Series:
-    prev_x = x.shift(1)
-    prev_x[:1] = x.values[0]
-    return prev_x
+    # shift the underlying array directly; Series.shift(1) upcasts to float
+    # and requires copying the first value back in afterwards
+    values = x.to_numpy()
+    return pd.Series(np.concatenate((values[:1], values[:-1])), index=x.index)
 
 
 _samephase_nb: int = 10
 
+# integer codes of the action types and results used in the formula; the
+# type_name/result_name columns are optional in the SPADL schema and string
+# comparisons are considerably slower than comparing these codes
+_shot_type_ids = [spadl.actiontypes.index(ty) for ty in ("shot", "shot_freekick", "shot_penalty")]
+_penalty_type_id = spadl.actiontypes.index("shot_penalty")
+_corner_type_ids = [spadl.actiontypes.index(ty) for ty in ("corner_crossed", "corner_short")]
+_success_result_id = spadl.results.index("success")
+
 
 def offensive_value(
     actions: DataFrame[SPADLSchema], scores: Series[float], concedes: Series[float]
@@ -50,21 +61,25 @@ def offensive_value(
 
     # if the previous action was too long ago, the odds of scoring are now 0
     toolong_idx = abs(actions.time_seconds - _prev(actions.time_seconds)) > _samephase_nb
-    prev_scores[toolong_idx] = 0.0
 
     # if the previous action was a goal, the odds of scoring are now 0
-    prevgoal_idx = (_prev(actions.type_name).isin(["shot", "shot_freekick", "shot_penalty"])) & (
-        _prev(actions.result_name) == "success"
+    prevgoal_idx = (_prev(actions.type_id).isin(_shot_type_ids)) & (
+        _prev(actions.result_id) == _success_result_id
     )
-    prev_scores[prevgoal_idx] = 0.0
 
     # fixed odds of scoring when penalty
-    penalty_idx = actions.type_name == "shot_penalty"
-    prev_scores[penalty_idx] = 0.792453
+    penalty_idx = actions.type_id == _penalty_type_id
 
     # fixed odds of scoring when corner
-    corner_idx = actions.type_name.isin(["corner_crossed", "corner_short"])
-    prev_scores[corner_idx] = 0.046500
+    corner_idx = actions.type_id.isin(_corner_type_ids)
+
+    # apply all overrides in a single pass; np.select keeps the first
+    # matching condition, so they are listed from highest to lowest priority
+    prev_scores = np.select(
+        [corner_idx, penalty_idx, prevgoal_idx | toolong_idx],
+        [0.046500, 0.792453, 0.0],
+        default=prev_scores,
+    )
 
     return scores - prev_scores
 
@@ -103,13 +118,14 @@ def defensive_value(
     prev_concedes = (_prev(concedes) * sameteam + _prev(scores) * (~sameteam)).astype(float)
 
     toolong_idx = abs(actions.time_seconds - _prev(actions.time_seconds)) > _samephase_nb
-    prev_concedes[toolong_idx] = 0.0
 
     # if the previous action was a goal, the odds of conceding are now 0
-    prevgoal_idx = (_prev(actions.type_name).isin(["shot", "shot_freekick", "shot_penalty"])) & (
-        _prev(actions.result_name) == "success"
+    prevgoal_idx = (_prev(actions.type_id).isin(_shot_type_ids)) & (
+        _prev(actions.result_id) == _success_result_id
     )
-    prev_concedes[prevgoal_idx] = 0.0
+
+    # apply both overrides in a single pass
+    prev_concedes = np.where(toolong_idx | prevgoal_idx, 0.0, prev_concedes)
 
     return -(concedes - prev_concedes)
 
@@ -1,11 +1,49 @@
 """Implements the label tranformers of the VAEP framework."""
 
+import numpy as np
 import pandas as pd  # type: ignore
+from numpy.lib.stride_tricks import sliding_window_view
 from pandera.typing import DataFrame
 
 import socceraction.spadl.config as spadl
 from socceraction.spadl.schema import SPADLSchema
 
+_shot_type_ids = [
+    spadl.actiontypes.index(ty) for ty in ("shot", "shot_penalty", "shot_freekick")
+]
+_success_result_id = spadl.results.index("success")
+_owngoal_result_id = spadl.results.index("owngoal")
+
+
+def _future_windows(
+    actions: DataFrame[SPADLSchema], nr_actions: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute goal, owngoal and team id windows over the next x actions.
+
+    Each returned array has shape (len(actions), nr_actions); row i holds the
+    values for action i and the nr_actions - 1 actions that follow it. The
+    windows are built with sliding views over the underlying arrays, padded by
+    repeating the last action, which avoids materializing 3 * (nr_actions - 1)
+    shifted columns.
+    """
+    shots = actions["type_name"].str.contains("shot").to_numpy()
+    result_id = actions["result_id"].to_numpy()
+    goals = shots & (result_id == _success_result_id)
+    owngoals = shots & (result_id == _owngoal_result_id)
+    team_id = actions["team_id"].to_numpy()
+
+    nr_pad = nr_actions - 1
+    goal_w = sliding_window_view(
+        np.concatenate((goals, np.repeat(goals[-1:], nr_pad))), nr_actions
+    )
+    owngoal_w = sliding_window_view(
+        np.concatenate((owngoals, np.repeat(owngoals[-1:], nr_pad))), nr_actions
+    )
+    team_w = sliding_window_view(
+        np.concatenate((team_id, np.repeat(team_id[-1:], nr_pad))), nr_actions
+    )
+    return goal_w, owngoal_w, team_w
+
 
 def scores(actions: DataFrame[SPADLSchema], nr_actions: int = 10) -> pd.DataFrame:
     """Determine whether the team possessing the ball scored a goal within the next x actions.
@@ -24,31 +62,12 @@ def scores(actions: DataFrame[SPADLSchema], nr_actions: int = 10) -> pd.DataFram
         True if a goal was scored by the team possessing the ball within the
         next x actions; otherwise False.
     """
-    # merging goals, owngoals and team_ids
+    goal_w, owngoal_w, team_w = _future_windows(actions, nr_actions)
 
-    goals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadl.results.index("success")
-    )
-    owngoals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadl.results.index("owngoal")
-    )
-    y = pd.concat([goals, owngoals, actions["team_id"]], axis=1)
-    y.columns = ["goal", "owngoal", "team_id"]
-
-    # adding future results
-    for i in range(1, nr_actions):
-        for c in ["team_id", "goal", "owngoal"]:
-            shifted = y[c].shift(-i)
-            shifted[-i:] = y[c].iloc[len(y) - 1]
-            y["%s+%d" % (c, i)] = shifted
-
-    res = y["goal"]
-    for i in range(1, nr_actions):
-        gi = y["goal+%d" % i] & (y["team_id+%d" % i] == y["team_id"])
-        ogi = y["owngoal+%d" % i] & (y["team_id+%d" % i] != y["team_id"])
-        res = res | gi | ogi
+    sameteam = team_w == team_w[:, :1]
+    res = ((goal_w & sameteam) | (owngoal_w & ~sameteam)).any(axis=1)
 
-    return pd.DataFrame(res, columns=["scores"])
+    return pd.DataFrame({"scores": res}, index=actions.index)
 
 
 def concedes(actions: DataFrame[SPADLSchema], nr_actions: int = 10) -> pd.DataFrame:
@@ -68,30 +87,12 @@ def concedes(actions: DataFrame[SPADLSchema], nr_actions: int = 10) -> pd.DataFr
         True if a goal was conceded by the team possessing the ball within the
         next x actions; otherwise False.
     """
-    # merging goals,owngoals and team_ids
-    goals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadl.results.index("success")
-    )
-    owngoals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadl.results.index("owngoal")
-    )
-    y = pd.concat([goals, owngoals, actions["team_id"]], axis=1)
-    y.columns = ["goal", "owngoal", "team_id"]
-
-    # adding future results
-    for i in range(1, nr_actions):
-        for c in ["team_id", "goal", "owngoal"]:
-            shifted = y[c].shift(-i)
-            shifted[-i:] = y[c].iloc[len(y) - 1]
-            y["%s+%d" % (c, i)] = shifted
+    goal_w, owngoal_w, team_w = _future_windows(actions, nr_actions)
 
-    res = y["owngoal"]
-    for i in range(1, nr_actions):
-        gi = y["goal+%d" % i] & (y["team_id+%d" % i] != y["team_id"])
-        ogi = y["owngoal+%d" % i] & (y["team_id+%d" % i] == y["team_id"])
-        res = res | gi | ogi
+    sameteam = team_w == team_w[:, :1]
+    res = ((goal_w & ~sameteam) | (owngoal_w & sameteam)).any(axis=1)
 
-    return pd.DataFrame(res, columns=["concedes"])
+    return pd.DataFrame({"concedes": res}, index=actions.index)
 
 
 def goal_from_shot(actions: DataFrame[SPADLSchema]) -> pd.DataFrame:
@@ -110,8 +111,8 @@ def goal_from_shot(actions: DataFrame[SPADLSchema]) -> pd.DataFrame:
         A dataframe with a column 'goal' and a row for each action set to
         True if a goal was scored from the current action; otherwise False.
     """
-    goals = actions["type_name"].str.contains("shot") & (
-        actions["result_id"] == spadl.results.index("success")
+    goals = np.isin(actions["type_id"].to_numpy(), _shot_type_ids) & (
+        actions["result_id"].to_numpy() == _success_result_id
     )
 
-    return pd.DataFrame(goals, columns=["goal_from_shot"])
+    return pd.DataFrame({"goal_from_shot": goals}, index=actions.index)